@@ -0,0 +1,55 @@
+"""
+One-off: export stress_model.pkl to stress_model.onnx for ONNX Runtime.
+
+    pip install skl2onnx onnxruntime
+    python convert_model.py
+
+stress_api.py picks up stress_model.onnx automatically when it exists (and
+then needs onnxruntime installed). The export is only written if ONNX Runtime
+predicts the same label as sklearn for every encoded input the API can send.
+"""
+import itertools
+import os
+
+import joblib
+import numpy as np
+import onnxruntime as ort
+import orjson
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+model = joblib.load(os.path.join(BASE_DIR, "stress_model.pkl"))
+with open(os.path.join(BASE_DIR, "feature_meta.json"), "rb") as f:
+    feature_meta = orjson.loads(f.read())
+
+if model.n_features_in_ != len(feature_meta["features"]):
+    raise SystemExit("stress_model.pkl and feature_meta.json disagree on the feature count; "
+                     "re-run export_feature_meta.py first")
+
+# zipmap=False keeps probabilities as a plain tensor; the API only reads "label".
+# No int8 quantization: a random forest is a TreeEnsemble op with no weight
+# tensors to quantize, and rounding split thresholds would change predictions.
+onnx_model = convert_sklearn(
+    model,
+    initial_types=[("input", FloatTensorType([None, model.n_features_in_]))],
+    options={id(model): {"zipmap": False}},
+)
+
+# Parity: every combination of category codes (numeric columns held at 0), in model column order
+codes = [
+    range(len(feature_meta["encoders"][name])) if name in feature_meta["encoders"] else [0]
+    for name in feature_meta["features"]
+]
+grid = np.array(list(itertools.product(*codes)), dtype=np.float32)
+session = ort.InferenceSession(onnx_model.SerializeToString(), providers=["CPUExecutionProvider"])
+onnx_labels = session.run(["label"], {"input": grid})[0]
+mismatches = int((onnx_labels != model.predict(grid)).sum())
+if mismatches:
+    raise SystemExit(f"ONNX export disagrees with sklearn on {mismatches}/{len(grid)} inputs; not written")
+
+with open(os.path.join(BASE_DIR, "stress_model.onnx"), "wb") as f:
+    f.write(onnx_model.SerializeToString())
+
+print(f"Wrote stress_model.onnx ({model.n_features_in_} features, {len(grid)} inputs match sklearn)")
@@ -0,0 +1,32 @@
+"""
+One-off: export top_features.pkl + top_feature_encoders.pkl to feature_meta.json.
+
+    python export_feature_meta.py
+
+stress_api.py reads feature_meta.json at startup instead of unpickling the
+LabelEncoders, so re-run this whenever the features or encoders are retrained.
+"""
+import os
+
+import joblib
+import orjson
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+top_features = joblib.load(os.path.join(BASE_DIR, "top_features.pkl"))
+top_feature_encoders = joblib.load(os.path.join(BASE_DIR, "top_feature_encoders.pkl"))
+
+# LabelEncoder codes are the index into classes_, so the class list is all we need
+feature_meta = {
+    "features": list(top_features),
+    "numeric": [name for name in top_features if name not in top_feature_encoders],
+    "encoders": {
+        name: [str(label) for label in encoder.classes_]
+        for name, encoder in top_feature_encoders.items()
+    },
+}
+
+with open(os.path.join(BASE_DIR, "feature_meta.json"), "wb") as f:
+    f.write(orjson.dumps(feature_meta, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+
+print(f"Wrote feature_meta.json ({len(top_features)} features, {len(top_feature_encoders)} encoders)")
@@ -1,50 +1,274 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pymongo import MongoClient 
 from bson import ObjectId
+from cachetools import LRUCache
 from typing import Any, Dict
 from pydantic import BaseModel
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from functools import partial
+import asyncio
+import httpx
+import ijson
 import joblib
+import math
+import msgspec
 import numpy as np
-import json
+import orjson
 import os
-import requests
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    """Per-worker resources: OpenRouter client, predict pool, batch queue and batcher."""
+    global http_client, predict_pool, predict_queue, predict_batcher_task, batches_in_flight
+    http_client = httpx.AsyncClient(
+        timeout=30,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            retries=2  # only retries failed connects, never a sent request
+        )
+    )
+    predict_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    predict_queue = asyncio.Queue()
+    batches_in_flight = 0
+    predict_batcher_task = asyncio.create_task(predict_batcher())
+
+    yield
+
+    predict_batcher_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await predict_batcher_task
+    predict_pool.shutdown(wait=False)
+    await http_client.aclose()
+
+# ✅ orjson decodes request bodies; responses are serialized by FastAPI straight to JSON
+#    from each route's return annotation (pydantic-core), no jsonable_encoder pass
+app = FastAPI(lifespan=lifespan)
 
 MONGO_URI = os.getenv("MONGO_URI")  # Store this in Render Environment
-mongo_client = MongoClient(MONGO_URI)
+# connect=False: don't open sockets until first use, so the client is safe to
+# create before gunicorn --preload forks the workers
+mongo_client = MongoClient(MONGO_URI, connect=False)
 mongo_db = mongo_client["stressapp"]
 history_collection = mongo_db["recommendations"]
 
 # ✅ Allow frontend access from any domain (or restrict later)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # or your frontend URL only
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Same behaviour as CORSMiddleware(allow_origins=["*"], allow_credentials=True,
+# allow_methods=["*"], allow_headers=["*"]) but with the headers prebuilt as bytes.
+# With credentials allowed the caller's origin is always echoed back, never "*".
+CORS_ALLOW_METHODS = (b"DELETE", b"GET", b"HEAD", b"OPTIONS", b"PATCH", b"POST", b"PUT", b"QUERY")
+CORS_PREFLIGHT_HEADERS = [
+    (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+              b"Access-Control-Request-Private-Network"),
+    (b"access-control-allow-methods", b", ".join(CORS_ALLOW_METHODS)),
+    (b"access-control-max-age", b"600"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+]
+
+class StaticCORSMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+
+        # Preflight: answer directly without touching the app
+        if origin is not None and scope["method"] == "OPTIONS" and b"access-control-request-method" in headers:
+            failures = []
+            if headers[b"access-control-request-method"] not in CORS_ALLOW_METHODS:
+                failures.append(b"method")
+            if b"access-control-request-private-network" in headers:
+                failures.append(b"private-network")
+            body = b"Disallowed CORS " + b", ".join(failures) if failures else b"OK"
+
+            preflight_headers = CORS_PREFLIGHT_HEADERS + [
+                (b"access-control-allow-origin", origin),
+                (b"content-length", str(len(body)).encode()),
+            ]
+            requested_headers = headers.get(b"access-control-request-headers")
+            if requested_headers is not None:
+                preflight_headers.append((b"access-control-allow-headers", requested_headers))
+
+            await send({
+                "type": "http.response.start",
+                "status": 400 if failures else 200,
+                "headers": preflight_headers
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        if origin is not None:
+            cors_headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+            ]
+        else:
+            cors_headers = []
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Responses always vary by Origin; merge with any Vary the app already set
+                response_headers = list(message.get("headers", []))
+                vary = [value for name, value in response_headers if name == b"vary"]
+                response_headers = [(name, value) for name, value in response_headers if name != b"vary"]
+                message["headers"] = response_headers + cors_headers + [
+                    (b"vary", b", ".join(vary + [b"Origin"]))
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+app.add_middleware(StaticCORSMiddleware)
 
 # ✅ Get the directory where this file is located
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # ✅ Use relative paths (this works locally + on Render)
 model_path = os.path.join(BASE_DIR, "stress_model.pkl")
-features_path = os.path.join(BASE_DIR, "top_features.pkl")
-encoders_path = os.path.join(BASE_DIR, "top_feature_encoders.pkl")
+onnx_model_path = os.path.join(BASE_DIR, "stress_model.onnx")
+feature_meta_path = os.path.join(BASE_DIR, "feature_meta.json")
+
+# ✅ Load once when server starts (in the gunicorn master with --preload, so the
+#    forked workers share the model's memory pages copy-on-write)
+# Prefer the ONNX Runtime export (generate it with convert_model.py), fall back to sklearn
+# (onnxruntime is optional: install it alongside skl2onnx when deploying the export)
+use_onnx = os.path.exists(onnx_model_path)
+if use_onnx:
+    import onnxruntime as ort
+
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = 1  # parallelism comes from predict_pool
+    onnx_session = ort.InferenceSession(
+        onnx_model_path, sess_options, providers=["CPUExecutionProvider"]
+    )
+
+    model_n_features = onnx_session.get_inputs()[0].shape[1]
+
+    def predict_batch(batch):
+        return onnx_session.run(["label"], {"input": batch})[0]
+else:
+    model = joblib.load(model_path)
+    model_n_features = model.n_features_in_
+    predict_batch = model.predict
+
+# Feature names + encoder classes as plain JSON (generate with export_feature_meta.py)
+with open(feature_meta_path, "rb") as f:
+    feature_meta = orjson.loads(f.read())
+top_features = feature_meta["features"]
+top_numeric_features = feature_meta["numeric"]
+top_feature_classes = feature_meta["encoders"]
+
+# ✅ Every model column must be declared exactly once, either numeric or categorical
+if (set(top_numeric_features) & set(top_feature_classes)
+        or set(top_features) != set(top_numeric_features) | set(top_feature_classes)):
+    raise RuntimeError(
+        "feature_meta.json must list every feature once under 'numeric' or 'encoders'; "
+        "re-run export_feature_meta.py"
+    )
+
+# ✅ Whichever model was loaded must take exactly the columns feature_meta.json lists
+if model_n_features != len(top_features):
+    raise RuntimeError(
+        f"model expects {model_n_features} features but feature_meta.json lists "
+        f"{len(top_features)}; re-run export_feature_meta.py / convert_model.py"
+    )
 
-# ✅ Load once when server starts
-model = joblib.load(model_path)
-top_features = joblib.load(features_path)
-top_feature_encoders = joblib.load(encoders_path)
+# ✅ Typed /predict schema in model column order: msgspec checks every feature is
+#    present and coerces numerics to float while decoding (strict=False accepts "7.5")
+PredictInput = msgspec.defstruct(
+    "PredictInput",
+    [(name, str if name in top_feature_classes else float) for name in top_features]
+)
+predict_decoder = msgspec.json.Decoder(PredictInput, strict=False)
+
+# ✅ (column index, label -> code table) for the categorical columns; LabelEncoder code = index in classes_
+categorical_columns = tuple(
+    (i, {label: code for code, label in enumerate(top_feature_classes[name])})
+    for i, name in enumerate(top_features) if name in top_feature_classes
+)
 
 # ✅ Get OpenRouter API Key
 API_KEY = os.getenv("OPENROUTER_API_KEY")
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# ✅ Shared async HTTP client so OpenRouter connections stay warm between requests
+#    (opened/closed in lifespan)
+http_client = None
+
+# ✅ Cache predictions by encoded feature tuple (only touched from the event loop, so no lock)
+prediction_cache = LRUCache(maxsize=4096)
+
+# ✅ Micro-batch concurrent /predict calls into a single model.predict
+MAX_BATCH = 64
+MAX_WAIT_MS = 5
+predict_queue = None
+predict_batcher_task = None
+batches_in_flight = 0
+
+# ✅ Forest / ONNX Runtime inference releases the GIL, so batches run in parallel off the event loop
+#    (created in lifespan, i.e. after gunicorn forks the worker)
+predict_pool = None
+
+def resolve_batch(futures, batch_future):
+    global batches_in_flight
+    batches_in_flight -= 1
+    if batch_future.cancelled():
+        return
+    if batch_future.exception() is not None:
+        for fut in futures:
+            if not fut.done():
+                fut.set_exception(batch_future.exception())
+        return
+
+    for fut, prediction in zip(futures, batch_future.result()):
+        if not fut.done():
+            fut.set_result(prediction)
+
+async def predict_batcher():
+    global batches_in_flight
+    loop = asyncio.get_running_loop()
+    while True:
+        row, fut = await predict_queue.get()
+        rows, futures = [row], [fut]
+
+        # Take whatever is already queued without waiting
+        while len(rows) < MAX_BATCH and not predict_queue.empty():
+            row, fut = predict_queue.get_nowait()
+            rows.append(row)
+            futures.append(fut)
+
+        # Only coalesce under load: when idle, a lone request is dispatched right away;
+        # while a batch is running, keep collecting until it's full or the window closes
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        while batches_in_flight and len(rows) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row, fut = await asyncio.wait_for(predict_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            rows.append(row)
+            futures.append(fut)
+
+        # Rows are already-encoded tuples, so the whole batch becomes one float32 array here
+        batch = np.array(rows, dtype=np.float32)
+
+        # Hand the batch to the pool and go straight back to collecting the next one
+        batch_future = loop.run_in_executor(predict_pool, predict_batch, batch)
+        batches_in_flight += 1
+        batch_future.add_done_callback(partial(resolve_batch, futures))
 
 @app.post("/save")
-async def save_recommendation(request: Request):
+async def save_recommendation(request: Request) -> Dict[str, str]:
     """
     Save a recommendation to MongoDB.
     Expected payload structure matches what PHP sends:
@@ -67,7 +291,7 @@ async def save_recommendation(request: Request):
     """
     try:
         # Get the payload from request body
-        payload = await request.json()
+        payload = orjson.loads(await request.body())
         
         # Validate user_id exists
         if "user_id" not in payload:
@@ -96,7 +320,7 @@ async def save_recommendation(request: Request):
         raise HTTPException(status_code=500, detail=f"Failed to save: {str(e)}")
 
 @app.get("/history")
-async def get_history(user_id: str, page: int = 1, items: int = 9):
+async def get_history(user_id: str, page: int = 1, items: int = 9) -> Dict[str, Any]:
     try:
         user_id = int(user_id)   # ✅ CORRECT
     except:
@@ -123,109 +347,119 @@ async def get_history(user_id: str, page: int = 1, items: int = 9):
     return {"totalPages": total_pages, "records": records}
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, Any]:
     return {
         "status": "ok",
         "message": "CalmViz API is running",
         "endpoints": ["/predict", "/chat", "/suggest"]
     }
 
+ACTIVITIES = {
+    "Low": "Listen to calming music",
+    "Medium": "Go for a walk",
+    "High": "Take deep breaths and meditate"
+}
+
 @app.post("/predict")
-async def predict(request: Request):
+async def predict(request: Request) -> Dict[str, str]:
     try:
-        raw_input_data = await request.json()
-
-        input_values = []
-        for feature_name in top_features:
-            if feature_name not in raw_input_data:
-                return {"error": f"Missing feature: {feature_name}"}
-            raw_value = raw_input_data[feature_name]
-
-            if feature_name in top_feature_encoders:
-                encoder = top_feature_encoders[feature_name]
-                encoded_val = encoder.transform([raw_value])[0]
-                input_values.append(encoded_val)
-            else:
-                input_values.append(float(raw_value))
-
-        input_array = np.array(input_values).reshape(1, -1)
-        prediction = model.predict(input_array)[0]
-
-        activities = {
-            "Low": "Listen to calming music",
-            "Medium": "Go for a walk",
-            "High": "Take deep breaths and meditate"
-        }
+        body = await request.body()
+        try:
+            raw_input = predict_decoder.decode(body)
+        except msgspec.ValidationError:
+            # Keep the original "Missing feature: X" wording the PHP client relies on;
+            # wrong types fall through to msgspec's message below
+            raw_input_data = orjson.loads(body)
+            missing = next((name for name in top_features if name not in raw_input_data), None)
+            if missing is not None:
+                return {"error": f"Missing feature: {missing}"}
+            raise
+
+        # Numeric columns are already floats; only the categorical ones need encoding
+        row = list(msgspec.structs.astuple(raw_input))
+        try:
+            for i, table in categorical_columns:
+                row[i] = table[row[i]]
+        except KeyError as e:
+            return {"error": f"Unknown category value: {e.args[0]}"}
+        row = tuple(row)
+
+        # Identical encoded rows always give the same label, so skip the model on a hit
+        prediction = prediction_cache.get(row)
+        if prediction is None:
+            fut = asyncio.get_running_loop().create_future()
+            predict_queue.put_nowait((row, fut))
+            prediction = await fut
+            prediction_cache[row] = prediction
 
         return {
             "stress_level": str(prediction),
-            "recommendation": activities.get(prediction, "No suggestion available")
+            "recommendation": ACTIVITIES.get(prediction, "No suggestion available")
         }
 
     except Exception as e:
         return {"error": str(e)}
 
+CHAT_SYSTEM_PROMPT = {
+    "role": "system",
+    "content": """You are CalmViz, a friendly and empathetic stress-relief assistant.
+            Respond warmly in 2–3 sentences. If asked to switch to Mandarin, reply:
+            '你好！今天我可以帮你做些什么呢？'"""
+}
+
+CHAT_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json",
+    "X-Title": "CalmViz Chat"
+}
+
 @app.post("/chat")
 async def chat(request: Request):
     try:
-        data = await request.json()
+        data = orjson.loads(await request.body())
         user_message = data.get("message", "")
 
-        system_prompt = {
-            "role": "system",
-            "content": """You are CalmViz, a friendly and empathetic stress-relief assistant.
-            Respond warmly in 2–3 sentences. If asked to switch to Mandarin, reply:
-            '你好！今天我可以帮你做些什么呢？'"""
-        }
-
         payload = {
             "model": "openai/gpt-4o-mini",
-            "messages": [system_prompt, {"role": "user", "content": user_message}]
+            "messages": [CHAT_SYSTEM_PROMPT, {"role": "user", "content": user_message}]
         }
 
-        headers = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-            "X-Title": "CalmViz Chat"
-        }
-
-        response = requests.post("https://openrouter.ai/api/v1/chat/completions",
-                                 json=payload, headers=headers)
-
-        # Return the JSON reply directly
-        return response.json()
+        upstream_request = http_client.build_request(
+            "POST", OPENROUTER_URL, json=payload, headers=CHAT_HEADERS
+        )
+        response = await http_client.send(upstream_request, stream=True)
+
+        # Only relay JSON; an HTML error page (gateway 502/503) becomes our error shape,
+        # keeping the upstream status (502 if it claimed success)
+        content_type = response.headers.get("content-type", "")
+        if not content_type.startswith("application/json"):
+            await response.aclose()
+            return Response(
+                content=orjson.dumps({
+                    "error": f"OpenRouter returned {response.status_code} ({content_type or 'no content type'})"
+                }),
+                status_code=response.status_code if response.is_error else 502,
+                media_type="application/json",
+            )
+
+        # Stream the JSON reply (success or OpenRouter's own JSON error) straight through with its status instead of decoding and re-encoding it;
+        # always release the upstream connection, even if the stream fails midway
+        async def relay():
+            try:
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return StreamingResponse(
+            relay(), status_code=response.status_code, media_type="application/json"
+        )
 
     except Exception as e:
         return {"error": str(e)}
 
-@app.post("/suggest")
-async def suggest(request: Request):
-    """
-    Accepts JSON:
-      { "activity": "...", "budget": "...", "lat": 1.23, "lng": 103.45, "town": "Kuala Lumpur" }
-
-    Returns: the assistant-provided JSON object (parsed) or an error object.
-    """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON body")
-
-    activity = body.get("activity", "") or ""
-    budget = body.get("budget", "") or ""
-    lat = body.get("lat", None)
-    lng = body.get("lng", None)
-    town = body.get("town", None)
-
-    # Build location part exactly like PHP
-    locationPart = ""
-    if lat and lng:
-        locationPart += f"User location: latitude = {lat}, longitude = {lng}. "
-    if town:
-        locationPart += f"User town: {town}."
-
-    # Full RULES / JSON format prompt (exact same as PHP)
-    RULES_FORMAT = '''
+# Full RULES / JSON format prompt (exact same as PHP)
+RULES_FORMAT = '''
 RESPONSE FORMAT: Return your answer ONLY as a JSON object.  
 Always follow this exact structure:
 
@@ -335,43 +569,103 @@ RULES:
 - Always return **valid JSON** only, with no text before or after.
 '''
 
-    prompt = f"You are an AI assistant that recommends stress-relief activities.\nUser input activity: {activity}\nUser budget: {budget}\n{locationPart}\n{RULES_FORMAT}"
+SUGGEST_PROMPT_HEAD = "You are an AI assistant that recommends stress-relief activities.\nUser input activity: %s\nUser budget: %s\n%s\n"
 
-    # Build OpenRouter request (exactly like PHP)
-    payload = {
-        "model": "openai/gpt-4o-mini",
-        "messages": [
-            {"role": "system", "content": "You are a helpful assistant that only outputs valid JSON."},
-            {"role": "user", "content": prompt}
-        ]
-    }
+SUGGEST_SYSTEM_PROMPT = {"role": "system", "content": "You are a helpful assistant that only outputs valid JSON."}
+
+SUGGEST_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {API_KEY}"
+}
+
+# ✅ Prebuilt /suggest request body, split where the per-request prompt head goes
+SUGGEST_PAYLOAD_PREFIX, SUGGEST_PAYLOAD_SUFFIX = orjson.dumps({
+    "model": "openai/gpt-4o-mini",
+    "messages": [
+        SUGGEST_SYSTEM_PROMPT,
+        {"role": "user", "content": "__PROMPT_HEAD__" + RULES_FORMAT}
+    ]
+}).split(b"__PROMPT_HEAD__")
+
+def parse_coordinate(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise TypeError("bool is not a coordinate")
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError("coordinate must be finite")
+    return value
+
+@app.post("/suggest")
+async def suggest(request: Request):
+    """
+    Accepts JSON:
+      { "activity": "...", "budget": "...", "lat": 1.23, "lng": 103.45, "town": "Kuala Lumpur" }
+
+    Returns: the assistant-provided JSON object (passed through as-is) or an error object.
+    """
+    try:
+        body = orjson.loads(await request.body())
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+    activity = body.get("activity", "") or ""
+    budget = body.get("budget", "") or ""
+    lat = body.get("lat", None)
+    lng = body.get("lng", None)
+    town = body.get("town", None)
+
+    # Coordinates must be finite numbers (not true/false or "nan"/"inf"); missing or empty means no location
+    try:
+        lat = parse_coordinate(lat)
+        lng = parse_coordinate(lng)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="lat and lng must be numbers")
+
+    # Build location part exactly like PHP
+    location_parts = []
+    if lat is not None and lng is not None:
+        location_parts.append(f"User location: latitude = {lat}, longitude = {lng}. ")
+    if town:
+        location_parts.append(f"User town: {town}.")
+    locationPart = "".join(location_parts)
+
+    prompt_head = SUGGEST_PROMPT_HEAD % (activity, budget, locationPart)
+
+    # Build OpenRouter request (exactly like PHP) by splicing the escaped prompt head
+    # into the prebuilt body; RULES_FORMAT is already escaped in the suffix
+    payload = SUGGEST_PAYLOAD_PREFIX + orjson.dumps(prompt_head)[1:-1] + SUGGEST_PAYLOAD_SUFFIX
 
     # Make API call to OpenRouter
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {API_KEY}"
-            },
-            json=payload,
-            timeout=30
-        )
-        response.raise_for_status()
-        
-        response_data = response.json()
-        
-        # Extract AI message content (same as PHP logic)
-        if "choices" in response_data and len(response_data["choices"]) > 0:
-            content = response_data["choices"][0]["message"]["content"]
-            # Parse the JSON string from AI and return it
-            return json.loads(content)
+        async with http_client.stream(
+            "POST", OPENROUTER_URL, headers=SUGGEST_HEADERS, content=payload
+        ) as response:
+            response.raise_for_status()
+
+            # Extract AI message content (same as PHP logic): feed the reply to ijson
+            # as it arrives and stop reading once choices[0].message.content is found
+            contents = ijson.sendable_list()
+            parser = ijson.items_coro(contents, "choices.item.message.content")
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                if contents:
+                    break
+            else:
+                parser.close()
+
+        if contents:
+            content = contents[0].encode("utf-8")
+            # Make sure the AI really returned JSON, then send its bytes as-is
+            orjson.loads(content)
+            return Response(content=content, media_type="application/json")
         else:
             raise HTTPException(status_code=500, detail="No response from AI")
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"API request failed: {str(e)}")
-    except json.JSONDecodeError as e:
+    except (orjson.JSONDecodeError, ijson.JSONError) as e:
         raise HTTPException(status_code=500, detail=f"Invalid JSON response: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -379,4 +673,15 @@ RULES:
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "stress_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=max(2, os.cpu_count() or 1),
+        backlog=2048,
+        timeout_keep_alive=30,
+        log_level="warning",
+        access_log=False
+    )
@@ -0,0 +1,60 @@
+"""StaticCORSMiddleware must answer exactly like the CORSMiddleware setup it replaced."""
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from stress_api import StaticCORSMiddleware
+
+
+def make_client(middleware, **options):
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        return {"ok": 1}
+
+    @app.post("/post")
+    async def post():
+        return {"ok": 2}
+
+    @app.get("/vary")
+    async def vary():
+        return JSONResponse({"ok": 3}, headers={"Vary": "Accept-Encoding"})
+
+    app.add_middleware(middleware, **options)
+    return TestClient(app)
+
+
+starlette_client = make_client(
+    CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
+)
+static_client = make_client(StaticCORSMiddleware)
+
+ORIGIN = {"Origin": "https://frontend.example"}
+PREFLIGHT = {**ORIGIN, "Access-Control-Request-Method": "POST"}
+
+
+@pytest.mark.parametrize("method, path, headers", [
+    ("GET", "/", {}),
+    ("GET", "/", ORIGIN),
+    ("GET", "/", {**ORIGIN, "Cookie": "session=1"}),
+    ("GET", "/", {**ORIGIN, "Authorization": "Bearer token"}),
+    ("POST", "/post", ORIGIN),
+    ("GET", "/vary", ORIGIN),
+    ("GET", "/vary", {}),
+    ("OPTIONS", "/post", PREFLIGHT),
+    ("OPTIONS", "/post", {**PREFLIGHT, "Access-Control-Request-Headers": "content-type, x-foo"}),
+    ("OPTIONS", "/post", {**ORIGIN, "Access-Control-Request-Method": "FOO"}),
+    ("OPTIONS", "/post", {**PREFLIGHT, "Access-Control-Request-Private-Network": "true"}),
+    ("OPTIONS", "/post", {"Access-Control-Request-Method": "POST"}),
+    ("OPTIONS", "/post", ORIGIN),
+])
+def test_static_cors_matches_starlette(method, path, headers):
+    def snapshot(response):
+        headers = sorted((name.lower(), value) for name, value in response.headers.items())
+        return response.status_code, response.content, headers
+
+    expected = snapshot(starlette_client.request(method, path, headers=headers))
+    assert snapshot(static_client.request(method, path, headers=headers)) == expected
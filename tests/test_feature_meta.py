@@ -0,0 +1,26 @@
+"""feature_meta.json must stay in sync with the pickles it was exported from."""
+import os
+
+import joblib
+import orjson
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load(name):
+    return joblib.load(os.path.join(BASE_DIR, name))
+
+
+def test_feature_meta_matches_pickles():
+    with open(os.path.join(BASE_DIR, "feature_meta.json"), "rb") as f:
+        feature_meta = orjson.loads(f.read())
+    top_features = load("top_features.pkl")
+    top_feature_encoders = load("top_feature_encoders.pkl")
+
+    assert feature_meta["features"] == list(top_features)
+    assert feature_meta["numeric"] == [name for name in top_features if name not in top_feature_encoders]
+    assert feature_meta["encoders"] == {
+        name: [str(label) for label in encoder.classes_]
+        for name, encoder in top_feature_encoders.items()
+    }
+    assert load("stress_model.pkl").n_features_in_ == len(feature_meta["features"])